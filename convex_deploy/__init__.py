@@ -0,0 +1,1125 @@
+"""
+Docker Compose orchestration script for Convex POC deployment.
+
+This module provides a simple interface to start and stop Docker Compose services.
+It uses subprocess to execute Docker Compose commands directly. Read-only
+commands (status, logs) talk to the Docker daemon through the Docker SDK for
+Python when it is installed (pip install docker), skipping the compose CLI
+bootstrap; without the SDK they fall back to the CLI.
+
+Installed with `pip install -e .` it is available as the `convex-deploy`
+command; scripts/deploy.py runs it straight from a checkout.
+"""
+
+import os
+import re
+import sys
+
+# asyncio, argparse, subprocess and friends are imported where they are used:
+# a bare `status` should not pay for importing them at startup.
+
+
+# File names compose looks for, in its own order of preference
+COMPOSE_FILE_NAMES = ("compose.yaml", "compose.yml", "docker-compose.yml", "docker-compose.yaml")
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "convex-poc")
+STATUS_CACHE_TTL = 0.5
+# Plain, non-interactive compose output: no TTY frame repainting, no colours
+COMPOSE_OUTPUT_FLAGS = ["--ansi", "never", "--progress", "plain"]
+
+# Shared Docker SDK client: None until first use, False if unavailable
+_docker_client = None
+# Parsed resolved compose config, loaded at most once per process
+_compose_config = None
+# Last SDK status listing: (time.monotonic(), compose file mtimes, text)
+_status_cache = None
+
+
+def compose_cmd(*args):
+    """
+    Build a Docker Compose command line for the project.
+
+    No -f is passed, so compose finds the compose file itself (searching
+    parent directories) and merges any override file or COMPOSE_FILE list.
+
+    Args:
+        *args: Compose subcommand and its arguments
+
+    Returns:
+        list: Command arguments suitable for subprocess
+    """
+    return ["docker", "compose", *COMPOSE_OUTPUT_FLAGS, *args]
+
+
+def parallel_flags(parallel):
+    """
+    Return compose's global option limiting how many services it handles at once.
+
+    Args:
+        parallel: Maximum parallelism, or None for compose's default (unlimited)
+
+    Returns:
+        list: Extra compose arguments, placed before the subcommand
+    """
+    return [] if parallel is None else ["--parallel", str(parallel)]
+
+
+def compose_files():
+    """
+    Locate the compose files compose itself would load.
+
+    Honours COMPOSE_FILE; otherwise searches the current directory and its
+    parents for a compose file and adds its `.override` sibling if present.
+
+    Returns:
+        list: Absolute paths, main file first; empty if none was found
+    """
+    listed = os.environ.get("COMPOSE_FILE")
+    if listed:
+        separator = os.environ.get("COMPOSE_PATH_SEPARATOR", os.pathsep)
+        return [os.path.abspath(path) for path in listed.split(separator) if path]
+
+    directory = os.getcwd()
+    while True:
+        for name in COMPOSE_FILE_NAMES:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                stem = os.path.splitext(name)[0]
+                for ext in (".yaml", ".yml"):
+                    override = os.path.join(directory, f"{stem}.override{ext}")
+                    if os.path.isfile(override):
+                        return [path, override]
+                return [path]
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return []
+        directory = parent
+
+
+def project_name():
+    """
+    Return the Compose project name that `up`/`down` operate on.
+
+    The resolved config carries compose's own answer, covering
+    COMPOSE_PROJECT_NAME from the environment or .env and a top-level `name:`.
+
+    Returns:
+        str: The resolved project name; without a config, COMPOSE_PROJECT_NAME
+        or the normalized compose file directory name
+    """
+    config = load_compose_config()
+    if config and config.get("name"):
+        return config["name"]
+    name = os.environ.get("COMPOSE_PROJECT_NAME")
+    if name:
+        return name
+    return re.sub(r"[^a-z0-9_-]", "", os.path.basename(project_dir()).lower())
+
+
+def project_dir():
+    """
+    Return the Compose project directory (where the main compose file lives).
+    """
+    files = compose_files()
+    return os.path.dirname(files[0]) if files else os.getcwd()
+
+
+def compose_cache_key():
+    """
+    Fingerprint everything that affects `docker compose config` output.
+
+    Covers every compose file (including overrides) and .env (path, mtime,
+    size) plus the values of the environment variables they interpolate.
+
+    Returns:
+        str: Short hex digest
+
+    Raises:
+        OSError: If no compose file is found or one cannot be read
+    """
+    import hashlib
+
+    files = compose_files()
+    if not files:
+        raise FileNotFoundError("no compose file found")
+
+    digest = hashlib.sha256()
+    variables = set()
+    for path in files:
+        st = os.stat(path)
+        digest.update(f"{path}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+        with open(path) as f:
+            variables.update(re.findall(r"\$\{?(\w+)", f.read()))
+
+    env_file = os.path.join(os.path.dirname(files[0]), ".env")
+    if os.path.isfile(env_file):
+        st = os.stat(env_file)
+        digest.update(f"{env_file}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+
+    variables.update(["COMPOSE_FILE", "COMPOSE_PROJECT_NAME", "COMPOSE_PROFILES"])
+    for var in sorted(variables):
+        digest.update(f"{var}={os.environ.get(var, '')}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def compose_cache_prefix():
+    """
+    Return the cache file prefix for the current set of compose files.
+
+    Separate checkouts (or COMPOSE_FILE setups) get separate prefixes, so they
+    never evict each other's cached config.
+
+    Returns:
+        str: `compose-<digest of the compose file paths>`
+    """
+    import hashlib
+
+    files = "\n".join(compose_files())
+    return f"compose-{hashlib.sha256(files.encode()).hexdigest()[:12]}"
+
+
+def cached_compose_file():
+    """
+    Return a resolved copy of the compose file, resolving it only when stale.
+
+    The output of `docker compose config --format json` is stored under
+    CACHE_DIR keyed by compose_cache_key(), so repeated invocations skip YAML
+    parsing and env interpolation. The file holds interpolated secrets (the
+    admin key), so it is only readable by the current user and replaces any
+    config previously cached for the same compose files.
+
+    Returns:
+        str or None: Path to the cached JSON config, or None if compose could
+        not resolve the project
+    """
+    try:
+        key = compose_cache_key()
+    except OSError:
+        return None
+    prefix = compose_cache_prefix()
+    path = os.path.join(CACHE_DIR, f"{prefix}-{key}.json")
+    if os.path.exists(path):
+        return path
+
+    import subprocess
+    import tempfile
+
+    try:
+        result = subprocess.run(
+            compose_cmd("config", "--format", "json"),
+            check=True,
+            capture_output=True,
+            text=True
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+    try:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(result.stdout)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        return None
+
+    remove_stale_compose_files(prefix, keep=path)
+    return path
+
+
+def remove_stale_compose_files(prefix, keep):
+    """
+    Delete this project's cached configs other than the current one.
+
+    Old entries hold interpolated secrets (e.g. a rotated admin key), so they
+    are removed rather than left to accumulate.
+
+    Args:
+        prefix: Cache file prefix of the project (see compose_cache_prefix)
+        keep: Path of the cache file to keep
+    """
+    import glob
+
+    for stale in glob.glob(os.path.join(CACHE_DIR, f"{prefix}-*.json")):
+        if stale != keep:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+
+def load_compose_config():
+    """
+    Return the resolved compose config as a dict.
+
+    Returns:
+        dict or None: Parsed config, or None if it could not be resolved
+    """
+    global _compose_config
+    if _compose_config is None:
+        import json
+
+        # A second attempt covers a cache file replaced by another process
+        # between cached_compose_file() and open(): it is simply re-resolved
+        for _ in range(2):
+            path = cached_compose_file()
+            if path is None:
+                return None
+            try:
+                with open(path) as f:
+                    _compose_config = json.load(f)
+                break
+            except FileNotFoundError:
+                continue
+    return _compose_config
+
+
+def cached_compose_cmd(*args):
+    """
+    Build a compose command line that reads the cached resolved config.
+
+    Only suitable for read-only subcommands (ps, logs); falls back to
+    compose_cmd() when no cached config is available.
+
+    Args:
+        *args: Compose subcommand and its arguments
+
+    Returns:
+        list: Command arguments suitable for subprocess
+    """
+    path = cached_compose_file()
+    if path is None:
+        return compose_cmd(*args)
+    return [
+        "docker", "compose", *COMPOSE_OUTPUT_FLAGS,
+        "--project-name", project_name(),
+        "--project-directory", project_dir(),
+        "-f", path,
+        *args
+    ]
+
+
+def docker_context_name():
+    """
+    Return the name of the Docker CLI context in effect, as the CLI resolves it.
+
+    DOCKER_HOST wins over any context, then DOCKER_CONTEXT, then the
+    currentContext saved by `docker context use` (in $DOCKER_CONFIG or
+    ~/.docker/config.json).
+
+    Returns:
+        str: Context name; "default" if none is selected
+    """
+    import json
+
+    if os.environ.get("DOCKER_HOST"):
+        return "default"
+    name = os.environ.get("DOCKER_CONTEXT")
+    if name:
+        return name
+    config_dir = os.environ.get("DOCKER_CONFIG") or os.path.join(os.path.expanduser("~"), ".docker")
+    try:
+        with open(os.path.join(config_dir, "config.json")) as f:
+            name = json.load(f).get("currentContext")
+    except (OSError, ValueError, AttributeError):
+        name = None
+    return name or "default"
+
+
+def get_docker_client():
+    """
+    Return the shared Docker SDK client, creating it on first use.
+
+    docker.from_env() only knows DOCKER_HOST and the default socket, so with
+    another Docker context selected the SDK could talk to a different daemon
+    than the CLI; the CLI is used then.
+
+    Returns:
+        docker.DockerClient or None: None if the SDK is not installed, a
+        non-default context is active or the daemon is unreachable, in which
+        case callers use the compose CLI
+    """
+    global _docker_client
+    if _docker_client is None:
+        if docker_context_name() != "default":
+            _docker_client = False
+            return None
+        try:
+            import docker
+        except ImportError:
+            _docker_client = False
+            return None
+        try:
+            _docker_client = docker.from_env()
+            _docker_client.ping()
+        except Exception:
+            # Daemon unreachable or misconfigured; the CLI reports it better
+            _docker_client = False
+    return _docker_client or None
+
+
+def project_containers(client, service=None):
+    """
+    List the containers belonging to this Compose project.
+
+    Args:
+        client: Docker SDK client
+        service: Optional service name to filter containers
+
+    Returns:
+        list: docker.models.containers.Container objects
+    """
+    labels = [f"com.docker.compose.project={project_name()}"]
+    if service:
+        labels.append(f"com.docker.compose.service={service}")
+    return client.containers.list(all=True, filters={"label": labels})
+
+
+def child_env():
+    """
+    Return the environment for child processes, with output unbuffered.
+
+    Returns:
+        dict: Copy of os.environ with PYTHONUNBUFFERED set
+    """
+    return {**os.environ, "PYTHONUNBUFFERED": "1"}
+
+
+def print_header(description, detail):
+    """
+    Print the banner shown before each operation.
+
+    The banner is flushed immediately so it precedes the output of the child
+    process that follows, even when stdout is a pipe.
+
+    Args:
+        description: Human-readable description of the operation
+        detail: Second line describing how the operation is carried out
+    """
+    print(f"\n{'='*60}")
+    print(f"{description}...")
+    print(detail)
+    print(f"{'='*60}\n", flush=True)
+
+
+def run_command(cmd, description):
+    """
+    Execute a command using subprocess and handle errors.
+
+    Args:
+        cmd: List of command arguments
+        description: Human-readable description of the command
+
+    Returns:
+        bool: True if command succeeded, False otherwise
+    """
+    import subprocess
+
+    print_header(description, f"Running: {' '.join(cmd)}")
+
+    try:
+        # Output is inherited, not captured: bytes go straight to the terminal
+        subprocess.run(cmd, check=True, env=child_env())
+        print(f"\n✓ {description} completed successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"\n✗ {description} failed with exit code {e.returncode}")
+        return False
+    except FileNotFoundError:
+        print(f"\n✗ Error: '{cmd[0]}' command not found. Please ensure Docker is installed and in PATH.")
+        return False
+
+
+def exec_command(cmd, description):
+    """
+    Replace the current process with a command.
+
+    For terminal operations with nothing left to do afterwards: no Python
+    process stays resident waiting for the child. Only returns on failure.
+
+    Args:
+        cmd: List of command arguments
+        description: Human-readable description of the command
+
+    Returns:
+        bool: False if the command could not be started
+    """
+    print_header(description, f"Running: {' '.join(cmd)}")
+    try:
+        os.execvpe(cmd[0], cmd, child_env())
+    except FileNotFoundError:
+        print(f"\n✗ Error: '{cmd[0]}' command not found. Please ensure Docker is installed and in PATH.")
+        return False
+
+
+async def run_command_async(cmd, description):
+    """
+    Awaitable counterpart of run_command() that does not block the event loop.
+
+    Args:
+        cmd: List of command arguments
+        description: Human-readable description of the command
+
+    Returns:
+        bool: True if command succeeded, False otherwise
+    """
+    import asyncio
+
+    print_header(description, f"Running: {' '.join(cmd)}")
+
+    try:
+        proc = await asyncio.create_subprocess_exec(*cmd, env=child_env())
+    except FileNotFoundError:
+        print(f"\n✗ Error: '{cmd[0]}' command not found. Please ensure Docker is installed and in PATH.")
+        return False
+    returncode = await proc.wait()
+    if returncode != 0:
+        print(f"\n✗ {description} failed with exit code {returncode}")
+        return False
+    print(f"\n✓ {description} completed successfully")
+    return True
+
+
+async def run_blocking(func, *args):
+    """
+    Run a blocking call (compose config resolution, SDK requests) in a thread.
+
+    Args:
+        func: Callable to run
+        *args: Positional arguments for func
+
+    Returns:
+        Whatever func returns
+    """
+    import asyncio
+    import functools
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
+
+def write_stdout(data):
+    """
+    Write raw bytes to the stdout file descriptor, bypassing sys.stdout.
+
+    Pending text printed through sys.stdout is flushed first so banners and
+    log output stay in order. When a caller has replaced sys.stdout with an
+    object that has no file descriptor (e.g. contextlib.redirect_stdout), the
+    bytes go to that object instead.
+
+    Args:
+        data: Bytes to write
+    """
+    sys.stdout.flush()
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is not None:
+            buffer.write(data)
+            buffer.flush()
+        else:
+            sys.stdout.write(data.decode(errors="replace"))
+        return
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def list_services():
+    """
+    List the services declared in the compose file.
+
+    Returns:
+        list: Service names, or an empty list if compose could not be queried
+    """
+    config = load_compose_config()
+    if config is None:
+        return []
+    return list(config.get("services", {}))
+
+
+def format_container_status(containers):
+    """
+    Format one name/state line per container.
+
+    Args:
+        containers: docker.models.containers.Container objects
+
+    Returns:
+        str: Newline-terminated listing
+    """
+    if not containers:
+        return "No containers found\n"
+    return "".join(f"  {container.name:<28} {container.status}\n" for container in containers)
+
+
+def print_container_status(containers):
+    """
+    Print one name/state line per container.
+
+    Args:
+        containers: docker.models.containers.Container objects
+    """
+    print(format_container_status(containers), end="")
+
+
+def compose_file_mtime():
+    """
+    Return the compose files' mtimes in nanoseconds, or None if one is missing.
+    """
+    try:
+        return tuple(os.stat(path).st_mtime_ns for path in compose_files())
+    except OSError:
+        return None
+
+
+def cached_status():
+    """
+    Return the last status listing if it is fresh enough to reuse.
+
+    Returns:
+        str or None: Listing younger than STATUS_CACHE_TTL taken against the
+        current compose files, otherwise None
+    """
+    import time
+
+    if _status_cache is None:
+        return None
+    timestamp, mtime, text = _status_cache
+    if time.monotonic() - timestamp >= STATUS_CACHE_TTL or mtime != compose_file_mtime():
+        return None
+    return text
+
+
+def invalidate_status_cache():
+    """
+    Forget the cached status listing after an operation changes containers.
+    """
+    global _status_cache
+    _status_cache = None
+
+
+def report_started_containers():
+    """
+    Show container states after an `up`, reusing the shared SDK client.
+
+    Skipped when the SDK is unavailable rather than forking another compose
+    CLI process just for `ps`.
+    """
+    client = get_docker_client()
+    if client is None:
+        return
+    print("\nContainer status:")
+    print_container_status(project_containers(client))
+
+
+async def deploy_up_async(detach=True, parallel=None, pull=False):
+    """
+    Start all Docker Compose services.
+
+    Args:
+        detach: If True, run in detached mode (default)
+        parallel: Maximum number of services compose handles at once
+        pull: If True, pull newer images before starting (`--pull always`);
+            by default only missing images are pulled
+    """
+    cmd = compose_cmd(*parallel_flags(parallel), "up")
+    if detach:
+        cmd.append("-d")
+    if pull:
+        cmd.extend(["--pull", "always"])
+
+    success = await run_command_async(cmd, "Starting Docker Compose services")
+    invalidate_status_cache()
+
+    if success and detach:
+        await run_blocking(report_started_containers)
+
+    if success:
+        print("\n" + "="*60)
+        print("Services are starting...")
+        print("\nAccess URLs:")
+        print("  - Frontend:     http://localhost:3000")
+        print("  - Convex API:   http://localhost:3210")
+        print("  - Convex Dashboard: http://localhost:6791")
+        print("\nTo view logs, run: docker compose logs -f")
+        print("="*60)
+
+    return success
+
+
+def deploy_up(detach=True, parallel=None, pull=False):
+    """
+    Blocking wrapper around deploy_up_async().
+    """
+    import asyncio
+
+    return asyncio.run(deploy_up_async(detach, parallel, pull))
+
+
+def prune_resources():
+    """
+    Remove dangling images left behind by rebuilt or re-pulled services.
+
+    Volumes are never touched, so the Convex data volume survives; use
+    `docker compose down -v` to delete it deliberately. Uses the shared Docker
+    SDK client when available, otherwise `docker image prune`.
+
+    Returns:
+        bool: True if the prune succeeded, False otherwise
+    """
+    description = "Pruning dangling images"
+    client = get_docker_client()
+    if client is None:
+        return run_command(
+            ["docker", "image", "prune", "-f", "--filter", "dangling=true"],
+            description
+        )
+
+    import docker.errors
+
+    print_header(description, "Using Docker daemon")
+    try:
+        images = client.images.prune(filters={"dangling": True})
+    except docker.errors.APIError as e:
+        print(f"\n✗ {description} failed: {e.explanation or e}")
+        return False
+    print(f"  Images deleted:  {len(images.get('ImagesDeleted') or [])}")
+    print(f"  Space reclaimed: {(images.get('SpaceReclaimed') or 0) / (1024 * 1024):.1f} MiB")
+    print(f"\n✓ {description} completed successfully")
+    return True
+
+
+async def deploy_down_async(parallel=None, prune=False):
+    """
+    Stop and remove all Docker Compose services.
+
+    Args:
+        parallel: Maximum number of services compose handles at once
+        prune: If True, also remove dangling images afterwards (see
+            prune_resources); volumes are kept
+    """
+    cmd = compose_cmd(*parallel_flags(parallel), "down")
+    success = await run_command_async(cmd, "Stopping Docker Compose services")
+    invalidate_status_cache()
+
+    if success and prune:
+        success = await run_blocking(prune_resources)
+
+    if success:
+        print("\n" + "="*60)
+        print("All services stopped and containers removed")
+        print("="*60)
+
+    return success
+
+
+def deploy_down(parallel=None, prune=False):
+    """
+    Blocking wrapper around deploy_down_async().
+    """
+    import asyncio
+
+    return asyncio.run(deploy_down_async(parallel, prune))
+
+
+async def deploy_restart_async(force=False, parallel=None):
+    """
+    Bring running services in line with the compose file.
+
+    `up -d` diffs the declared state against the running containers and only
+    recreates services whose configuration or image changed, so a no-op
+    restart costs almost nothing.
+
+    Args:
+        force: If True, tear everything down and start it again instead
+        parallel: Maximum number of services compose handles at once
+    """
+    if force:
+        return (await deploy_down_async(parallel=parallel)
+                and await deploy_up_async(parallel=parallel))
+
+    cmd = compose_cmd(*parallel_flags(parallel), "up", "-d", "--remove-orphans")
+    success = await run_command_async(cmd, "Restarting changed Docker Compose services")
+    invalidate_status_cache()
+    if success:
+        await run_blocking(report_started_containers)
+    return success
+
+
+def deploy_restart(force=False, parallel=None):
+    """
+    Blocking wrapper around deploy_restart_async().
+    """
+    import asyncio
+
+    return asyncio.run(deploy_restart_async(force, parallel))
+
+
+def deploy_status(replace_process=False, use_cache=True):
+    """
+    Show status of all Docker Compose services.
+
+    Listings obtained through the Docker SDK are reused for STATUS_CACHE_TTL
+    seconds, so callers importing this module and polling in a loop do not
+    query the daemon each time. The cache lives in this process only; CLI
+    output goes straight to the terminal and is not cached.
+
+    Args:
+        replace_process: If True and the compose CLI is needed, exec it in
+            place of this process instead of waiting for it
+        use_cache: If False, always query the current state
+    """
+    global _status_cache
+    import time
+
+    description = "Checking service status"
+    text = cached_status() if use_cache else None
+    if text is not None:
+        print_header(description, f"Cached (less than {STATUS_CACHE_TTL}s old)")
+        print(text, end="")
+        print(f"\n✓ {description} completed successfully")
+        return True
+
+    client = get_docker_client()
+    if client is None:
+        cmd = cached_compose_cmd("ps")
+        if replace_process:
+            return exec_command(cmd, description)
+        return run_command(cmd, description)
+
+    print_header(description, f"Querying Docker daemon (project: {project_name()})")
+    text = format_container_status(project_containers(client))
+    _status_cache = (time.monotonic(), compose_file_mtime(), text)
+    print(text, end="")
+    print(f"\n✓ {description} completed successfully")
+    return True
+
+
+def close_log_stream(stream):
+    """
+    Close a Docker SDK log stream, unblocking any thread reading from it.
+
+    Args:
+        stream: Object returned by container.logs(stream=True)
+    """
+    close = getattr(stream, "close", None)
+    if close is not None:
+        close()
+
+
+def stream_container_logs(containers, follow, description, opened=None):
+    """
+    Write container logs to stdout using the Docker SDK.
+
+    Args:
+        containers: Containers whose logs should be shown
+        follow: If True, keep streaming new output (single container only)
+        description: Human-readable description of the operation
+        opened: Optional list that receives each stream as it is opened, so
+            another thread can close it to stop a follow
+
+    Returns:
+        bool: True once all logs have been written
+    """
+    print_header(description, "Streaming from Docker daemon")
+    for container in containers:
+        if len(containers) > 1:
+            write_stdout(f"--- {container.name} ---\n".encode())
+        stream = container.logs(stream=True, follow=follow)
+        if opened is not None:
+            opened.append(stream)
+        try:
+            for chunk in stream:
+                write_stdout(chunk)
+        finally:
+            close_log_stream(stream)
+    return True
+
+
+def logs_description(service):
+    """
+    Return the banner text for a logs operation.
+    """
+    return f"Showing logs{' for ' + service if service else ''}"
+
+
+def check_log_service(service, services):
+    """
+    Check a requested service against the services in the compose config.
+
+    Args:
+        service: Requested service name, or None for all services
+        services: Service names from list_services(); empty skips the check
+
+    Returns:
+        bool: False (after printing an error) if the service is unknown
+    """
+    if service and services and service not in services:
+        print(f"\n✗ Unknown service '{service}'. Available services: {', '.join(services)}")
+        return False
+    return True
+
+
+def sdk_log_containers(service, follow):
+    """
+    Return the containers to stream through the Docker SDK, if it applies.
+
+    Several followed streams are left to a single `docker compose logs -f`,
+    which merges and prefixes them itself.
+
+    Args:
+        service: Optional service name to filter logs
+        follow: If True, logs will be followed
+
+    Returns:
+        list or None: Containers to stream, or None to use the compose CLI
+    """
+    client = get_docker_client()
+    if client is None:
+        return None
+    containers = project_containers(client, service)
+    if not follow or len(containers) == 1:
+        return containers
+    return None
+
+
+async def deploy_logs_cli_async(service, follow, replace_process):
+    """
+    Show logs through one compose CLI process (see deploy_logs_async).
+    """
+    description = logs_description(service)
+    cmd = await run_blocking(cached_compose_cmd, "logs")
+    if follow:
+        cmd.append("-f")
+    if service:
+        cmd.append(service)
+
+    if replace_process:
+        return exec_command(cmd, description)
+    return await run_command_async(cmd, description)
+
+
+async def deploy_logs_async(service=None, follow=False, replace_process=False):
+    """
+    Show logs from Docker Compose services.
+
+    A service name is checked against the (cached) compose config first, so
+    typos fail without reaching Docker; without one the config is not needed.
+
+    A Docker SDK stream is read in an executor thread; cancelling the call
+    closes the stream so that thread finishes too.
+
+    Args:
+        service: Optional service name to filter logs
+        follow: If True, follow log output (like tail -f)
+        replace_process: If True and a single compose CLI process is needed,
+            exec it in place of this process instead of waiting for it
+    """
+    import asyncio
+
+    if service and not check_log_service(service, await run_blocking(list_services)):
+        return False
+
+    containers = await run_blocking(sdk_log_containers, service, follow)
+    if containers is not None:
+        opened = []
+        try:
+            return await run_blocking(
+                stream_container_logs, containers, follow, logs_description(service), opened
+            )
+        except asyncio.CancelledError:
+            for stream in opened:
+                close_log_stream(stream)
+            raise
+
+    return await deploy_logs_cli_async(service, follow, replace_process)
+
+
+def deploy_logs(service=None, follow=False, replace_process=False):
+    """
+    Blocking counterpart of deploy_logs_async().
+
+    A Docker SDK stream is read here on the main thread rather than in an
+    executor thread, and Ctrl-C simply ends the output (as it does for
+    `docker compose logs -f`).
+    """
+    import asyncio
+
+    try:
+        if service and not check_log_service(service, list_services()):
+            return False
+
+        containers = sdk_log_containers(service, follow)
+        if containers is not None:
+            return stream_container_logs(containers, follow, logs_description(service))
+
+        return asyncio.run(deploy_logs_cli_async(service, follow, replace_process))
+    except KeyboardInterrupt:
+        return True
+
+
+FAST_ACTIONS = ("status", "up", "down")
+
+
+def fast_dispatch(action):
+    """
+    Run a bare `status`, `up` or `down` without building the argparse parser.
+
+    A CLI `status` is the last thing the process does, so instead of waiting
+    on a child it replaces the Python process with `docker compose ps`.
+
+    Args:
+        action: One of FAST_ACTIONS
+
+    Returns:
+        bool: True if the action succeeded (`status` only returns on error
+        or when answered through the Docker SDK)
+    """
+    if action == "up":
+        return deploy_up()
+    if action == "down":
+        return deploy_down()
+    return deploy_status(replace_process=True)
+
+
+def build_parser():
+    """
+    Build the argparse parser for the deployment CLI.
+
+    Returns:
+        argparse.ArgumentParser: Parser with one subcommand per action
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Docker Compose orchestration for Convex POC",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+'restart' runs an idempotent 'docker compose up -d': unchanged services keep
+running and only stale ones are recreated.
+
+Examples:
+  %(prog)s up              Start all services in detached mode
+  %(prog)s up --pull       Pull newer images, then start all services
+  %(prog)s up --no-detach  Start all services in foreground
+  %(prog)s down            Stop and remove all services
+  %(prog)s down --prune    Stop all services, then remove dangling images
+  %(prog)s restart         Recreate only services whose config or image changed
+  %(prog)s restart --force Stop and remove all services, then start them again
+  %(prog)s status          Show service status
+  %(prog)s logs            Show logs from all services
+  %(prog)s logs -f         Follow logs (like tail -f)
+  %(prog)s logs backend    Show logs for backend service only
+  %(prog)s logs -f backend Follow logs for backend service only
+        """
+    )
+
+    parallel_parser = argparse.ArgumentParser(add_help=False)
+    parallel_parser.add_argument(
+        "--parallel",
+        type=int,
+        help="Maximum number of services compose handles at once (default: unlimited)"
+    )
+
+    sub = parser.add_subparsers(dest="command", metavar="action", required=True)
+
+    up_parser = sub.add_parser(
+        "up",
+        parents=[parallel_parser],
+        help="Start all services"
+    )
+    up_parser.add_argument(
+        "--no-detach",
+        action="store_true",
+        help="Run in foreground"
+    )
+    up_parser.add_argument(
+        "--pull",
+        action="store_true",
+        help="Pull newer images before starting (default: only pull missing ones)"
+    )
+
+    down_parser = sub.add_parser(
+        "down",
+        parents=[parallel_parser],
+        help="Stop and remove all services"
+    )
+    down_parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="Also remove dangling images (volumes, including Convex data, are kept)"
+    )
+
+    restart_parser = sub.add_parser(
+        "restart",
+        parents=[parallel_parser],
+        help="Recreate services whose config or image changed"
+    )
+    restart_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recreate every service with down + up"
+    )
+
+    sub.add_parser("status", help="Show service status")
+
+    logs_parser = sub.add_parser("logs", help="Show service logs")
+    logs_parser.add_argument(
+        "service",
+        nargs="?",
+        help="Only show logs for this service"
+    )
+    logs_parser.add_argument(
+        "-f",
+        "--follow",
+        action="store_true",
+        help="Follow log output (like tail -f)"
+    )
+
+    return parser
+
+
+def main():
+    """
+    Main entry point for the deployment script.
+    """
+    if len(sys.argv) == 2 and sys.argv[1] in FAST_ACTIONS:
+        sys.exit(0 if fast_dispatch(sys.argv[1]) else 1)
+
+    parser = build_parser()
+    args = parser.parse_args()
+
+    # Execute the requested action
+    if args.command == "up":
+        success = deploy_up(
+            detach=not args.no_detach,
+            parallel=args.parallel,
+            pull=args.pull
+        )
+    elif args.command == "down":
+        success = deploy_down(parallel=args.parallel, prune=args.prune)
+    elif args.command == "restart":
+        success = deploy_restart(force=args.force, parallel=args.parallel)
+    elif args.command == "status":
+        success = deploy_status(replace_process=True)
+    elif args.command == "logs":
+        success = deploy_logs(
+            service=args.service,
+            follow=args.follow,
+            replace_process=True
+        )
+    else:
+        parser.print_help()
+        success = False
+
+    # Exit with appropriate code
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import os
+
+import pytest
+
+import convex_deploy
+
+
+@pytest.fixture(autouse=True)
+def reset_state(monkeypatch):
+    """Start every test without a cached config, SDK client or status."""
+    monkeypatch.setattr(convex_deploy, "_compose_config", None)
+    monkeypatch.setattr(convex_deploy, "_docker_client", None)
+    monkeypatch.setattr(convex_deploy, "_status_cache", None)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A project directory holding a compose file, used as the cwd."""
+    for var in ("COMPOSE_FILE", "COMPOSE_PROJECT_NAME", "COMPOSE_PROFILES", "RUST_LOG"):
+        monkeypatch.delenv(var, raising=False)
+    (tmp_path / "docker-compose.yml").write_text(
+        "services:\n  backend:\n    environment:\n      - RUST_LOG=${RUST_LOG:-info}\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(convex_deploy, "CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path
+
+
+@pytest.fixture
+def bump_mtime():
+    """Move a file's mtime one second forward."""
+    def bump(path):
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    return bump
@@ -0,0 +1,44 @@
+import pytest
+
+import convex_deploy
+
+
+@pytest.fixture
+def parse():
+    return convex_deploy.build_parser().parse_args
+
+
+@pytest.mark.parametrize("argv", [
+    ["logs", "-f", "backend"],
+    ["logs", "backend", "-f"],
+    ["logs", "--follow", "backend"],
+])
+def test_logs_follow_and_service_in_any_order(parse, argv):
+    args = parse(argv)
+    assert (args.command, args.service, args.follow) == ("logs", "backend", True)
+
+
+def test_logs_defaults(parse):
+    args = parse(["logs"])
+    assert (args.service, args.follow) == (None, False)
+
+
+@pytest.mark.parametrize("argv", [
+    ["status", "--foo"],
+    ["status", "-f"],
+    ["status", "backend"],
+    ["up", "--prune"],
+])
+def test_actions_reject_unknown_arguments(parse, argv):
+    with pytest.raises(SystemExit):
+        parse(argv)
+
+
+def test_action_is_required(parse):
+    with pytest.raises(SystemExit):
+        parse([])
+
+
+def test_parallel_applies_to_lifecycle_actions(parse):
+    assert parse(["restart", "--parallel", "2"]).parallel == 2
+    assert parse(["up"]).parallel is None
@@ -0,0 +1,146 @@
+import os
+import stat
+import subprocess
+
+import pytest
+
+import convex_deploy
+
+
+def test_compose_cache_key_is_stable(project):
+    assert convex_deploy.compose_cache_key() == convex_deploy.compose_cache_key()
+
+
+def test_compose_cache_key_found_from_subdirectory(project, monkeypatch):
+    key = convex_deploy.compose_cache_key()
+    (project / "scripts").mkdir()
+    monkeypatch.chdir(project / "scripts")
+    assert convex_deploy.compose_cache_key() == key
+
+
+def test_compose_cache_key_tracks_compose_files(project, bump_mtime):
+    key = convex_deploy.compose_cache_key()
+    bump_mtime(project / "docker-compose.yml")
+    edited = convex_deploy.compose_cache_key()
+    assert edited != key
+
+    (project / "docker-compose.override.yml").write_text("services: {}\n")
+    assert convex_deploy.compose_cache_key() != edited
+
+
+def test_compose_cache_key_tracks_env_file(project):
+    key = convex_deploy.compose_cache_key()
+    (project / ".env").write_text("RUST_LOG=debug\n")
+    assert convex_deploy.compose_cache_key() != key
+
+
+def test_compose_cache_key_tracks_interpolated_variables(project, monkeypatch):
+    key = convex_deploy.compose_cache_key()
+    monkeypatch.setenv("UNRELATED_VARIABLE", "1")
+    assert convex_deploy.compose_cache_key() == key
+    monkeypatch.setenv("RUST_LOG", "debug")
+    assert convex_deploy.compose_cache_key() != key
+
+
+def test_compose_cache_key_without_compose_file(tmp_path, monkeypatch):
+    monkeypatch.delenv("COMPOSE_FILE", raising=False)
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(OSError):
+        convex_deploy.compose_cache_key()
+
+
+def test_cached_compose_file_replaces_stale_entries(project, monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout='{"services": {"backend": {}}}')
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    first = convex_deploy.cached_compose_file()
+    assert stat.S_IMODE(os.stat(first).st_mode) == 0o600
+    assert convex_deploy.cached_compose_file() == first
+    assert len(calls) == 1
+
+    (project / ".env").write_text("CONVEX_SELF_HOSTED_ADMIN_KEY=rotated\n")
+    second = convex_deploy.cached_compose_file()
+    assert second != first
+    assert os.listdir(project / "cache") == [os.path.basename(second)]
+
+
+@pytest.fixture
+def fake_config(monkeypatch):
+    """Make `docker compose config` return a minimal project."""
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout='{"name": "p", "services": {}}')
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    return calls
+
+
+def test_cached_compose_file_keeps_other_projects(project, fake_config):
+    other = project / "cache" / "compose-0123456789ab-0000000000000000.json"
+    other.parent.mkdir()
+    other.write_text("{}")
+
+    path = convex_deploy.cached_compose_file()
+    (project / ".env").write_text("CHANGED=1\n")
+    convex_deploy.cached_compose_file()
+
+    assert other.exists()
+    assert not os.path.exists(path)
+
+
+def test_cache_prefix_depends_on_compose_files(project):
+    prefix = convex_deploy.compose_cache_prefix()
+    (project / "docker-compose.override.yml").write_text("services: {}\n")
+    assert convex_deploy.compose_cache_prefix() != prefix
+
+
+def test_load_compose_config_survives_vanished_cache_file(project, fake_config, monkeypatch):
+    path = convex_deploy.cached_compose_file()
+    real_open = open
+    vanished = []
+
+    def racing_open(name, *args, **kwargs):
+        if name == path and not vanished:
+            vanished.append(name)
+            os.remove(name)
+        return real_open(name, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", racing_open)
+    assert convex_deploy.load_compose_config() == {"name": "p", "services": {}}
+    assert vanished == [path]
+
+
+def test_project_name_comes_from_resolved_config(project, monkeypatch):
+    monkeypatch.setattr(convex_deploy, "_compose_config", {"name": "from-env-file", "services": {}})
+    assert convex_deploy.project_name() == "from-env-file"
+
+
+def test_project_name_falls_back_to_directory(project, monkeypatch):
+    monkeypatch.setattr(convex_deploy, "load_compose_config", lambda: None)
+    monkeypatch.setattr(convex_deploy, "project_dir", lambda: "/srv/Convex POC")
+    assert convex_deploy.project_name() == "convexpoc"
+
+
+def test_project_containers_filter_on_resolved_name(monkeypatch):
+    monkeypatch.setattr(convex_deploy, "_compose_config", {"name": "custom", "services": {}})
+    seen = {}
+
+    class Containers:
+        def list(self, **kwargs):
+            seen.update(kwargs)
+            return []
+
+    class Client:
+        containers = Containers()
+
+    convex_deploy.project_containers(Client(), "backend")
+    assert seen["filters"]["label"] == [
+        "com.docker.compose.project=custom",
+        "com.docker.compose.service=backend",
+    ]
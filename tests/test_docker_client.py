@@ -0,0 +1,57 @@
+import json
+import sys
+import types
+
+import pytest
+
+import convex_deploy
+
+
+@pytest.fixture
+def docker_config(tmp_path, monkeypatch):
+    """An empty Docker CLI config directory with no context variables set."""
+    for var in ("DOCKER_HOST", "DOCKER_CONTEXT"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv("DOCKER_CONFIG", str(tmp_path))
+
+    def use_context(name):
+        (tmp_path / "config.json").write_text(json.dumps({"currentContext": name}))
+    return use_context
+
+
+@pytest.fixture
+def fake_sdk(monkeypatch):
+    """A stand-in docker module whose clients always answer ping()."""
+    client = types.SimpleNamespace(ping=lambda: True)
+    monkeypatch.setitem(sys.modules, "docker", types.SimpleNamespace(from_env=lambda: client))
+    return client
+
+
+def test_context_defaults_without_config(docker_config):
+    assert convex_deploy.docker_context_name() == "default"
+
+
+def test_context_from_config_file(docker_config):
+    docker_config("colima")
+    assert convex_deploy.docker_context_name() == "colima"
+
+
+def test_context_env_overrides_config_file(docker_config, monkeypatch):
+    docker_config("colima")
+    monkeypatch.setenv("DOCKER_CONTEXT", "remote")
+    assert convex_deploy.docker_context_name() == "remote"
+
+
+def test_docker_host_overrides_context(docker_config, monkeypatch):
+    monkeypatch.setenv("DOCKER_CONTEXT", "remote")
+    monkeypatch.setenv("DOCKER_HOST", "tcp://127.0.0.1:2375")
+    assert convex_deploy.docker_context_name() == "default"
+
+
+def test_sdk_used_with_default_context(docker_config, fake_sdk):
+    assert convex_deploy.get_docker_client() is fake_sdk
+
+
+def test_sdk_skipped_with_other_context(docker_config, fake_sdk):
+    docker_config("colima")
+    assert convex_deploy.get_docker_client() is None
@@ -0,0 +1,57 @@
+import pytest
+
+import convex_deploy
+
+
+@pytest.fixture
+def commands(monkeypatch):
+    """Capture the commands the lifecycle actions run, without the SDK."""
+    calls = []
+
+    def fake_run(cmd, description):
+        calls.append(cmd)
+        return True
+
+    async def fake_run_async(cmd, description):
+        return fake_run(cmd, description)
+
+    monkeypatch.setattr(convex_deploy, "get_docker_client", lambda: None)
+    monkeypatch.setattr(convex_deploy, "run_command", fake_run)
+    monkeypatch.setattr(convex_deploy, "run_command_async", fake_run_async)
+    return calls
+
+
+def test_down_prune_falls_back_to_image_prune(commands):
+    assert convex_deploy.deploy_down(prune=True)
+    assert commands == [
+        convex_deploy.compose_cmd("down"),
+        ["docker", "image", "prune", "-f", "--filter", "dangling=true"],
+    ]
+
+
+def test_restart_recreates_changed_services_only(commands):
+    assert convex_deploy.deploy_restart()
+    assert commands == [convex_deploy.compose_cmd("up", "-d", "--remove-orphans")]
+
+
+def test_restart_passes_parallel_before_subcommand(commands):
+    assert convex_deploy.deploy_restart(parallel=2)
+    assert commands == [convex_deploy.compose_cmd("--parallel", "2", "up", "-d", "--remove-orphans")]
+
+
+def test_restart_force_runs_down_then_up(commands):
+    assert convex_deploy.deploy_restart(force=True, parallel=2)
+    assert commands == [
+        convex_deploy.compose_cmd("--parallel", "2", "down"),
+        convex_deploy.compose_cmd("--parallel", "2", "up", "-d"),
+    ]
+
+
+def test_restart_force_stops_when_down_fails(commands, monkeypatch):
+    async def fail(cmd, description):
+        commands.append(cmd)
+        return False
+
+    monkeypatch.setattr(convex_deploy, "run_command_async", fail)
+    assert not convex_deploy.deploy_restart(force=True)
+    assert commands == [convex_deploy.compose_cmd("down")]
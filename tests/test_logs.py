@@ -0,0 +1,87 @@
+import asyncio
+import contextlib
+import io
+
+import pytest
+
+import convex_deploy
+
+
+def test_write_stdout_to_redirected_text_stream():
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        convex_deploy.write_stdout(b"line\n")
+    assert out.getvalue() == "line\n"
+
+
+def test_write_stdout_to_stream_without_descriptor():
+    raw = io.BytesIO()
+    text = io.TextIOWrapper(raw)
+    with contextlib.redirect_stdout(text):
+        convex_deploy.write_stdout(b"\xffbytes\n")
+    assert raw.getvalue() == b"\xffbytes\n"
+
+
+def test_write_stdout_to_descriptor(capfd):
+    convex_deploy.write_stdout(b"direct\n")
+    assert capfd.readouterr().out == "direct\n"
+
+
+@pytest.fixture
+def cli_logs(monkeypatch):
+    """Run logs through the CLI path and capture the commands it starts."""
+    calls = []
+
+    async def fake_run(cmd, description):
+        calls.append(cmd)
+        return True
+
+    monkeypatch.setattr(convex_deploy, "get_docker_client", lambda: None)
+    monkeypatch.setattr(convex_deploy, "list_services", lambda: ["backend", "dashboard"])
+    monkeypatch.setattr(convex_deploy, "cached_compose_cmd", lambda *args: ["compose", *args])
+    monkeypatch.setattr(convex_deploy, "run_command_async", fake_run)
+    return calls
+
+
+def test_logs_all_services_use_one_process(cli_logs):
+    assert convex_deploy.deploy_logs()
+    assert cli_logs == [["compose", "logs"]]
+
+
+def test_logs_follow_all_services_use_one_process(cli_logs):
+    assert convex_deploy.deploy_logs(follow=True)
+    assert cli_logs == [["compose", "logs", "-f"]]
+
+
+def test_logs_follow_single_service(cli_logs):
+    assert asyncio.run(convex_deploy.deploy_logs_async("backend", follow=True))
+    assert cli_logs == [["compose", "logs", "-f", "backend"]]
+
+
+def test_check_log_service_rejects_unknown_service(capsys):
+    assert not convex_deploy.check_log_service("backedn", ["backend", "dashboard"])
+    assert "Unknown service 'backedn'. Available services: backend, dashboard" in capsys.readouterr().out
+
+
+def test_check_log_service_accepts_known_or_missing_service():
+    assert convex_deploy.check_log_service("backend", ["backend", "dashboard"])
+    assert convex_deploy.check_log_service(None, ["backend", "dashboard"])
+
+
+def test_check_log_service_skips_check_without_services():
+    assert convex_deploy.check_log_service("backend", [])
+
+
+def test_logs_unknown_service_fails_before_docker(cli_logs):
+    assert not convex_deploy.deploy_logs("backedn")
+    assert cli_logs == []
+
+
+def test_logs_without_service_skip_service_lookup(cli_logs, monkeypatch):
+    def fail():
+        raise AssertionError("list_services() should not run")
+
+    monkeypatch.setattr(convex_deploy, "list_services", fail)
+    assert convex_deploy.deploy_logs()
+    assert asyncio.run(convex_deploy.deploy_logs_async(follow=True))
+    assert cli_logs == [["compose", "logs"], ["compose", "logs", "-f"]]
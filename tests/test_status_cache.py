@@ -0,0 +1,38 @@
+import pytest
+
+import convex_deploy
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("time.monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def cached(project, clock, monkeypatch):
+    """Seed the status cache with a listing taken now."""
+    monkeypatch.setattr(
+        convex_deploy, "_status_cache", (clock[0], convex_deploy.compose_file_mtime(), "listing")
+    )
+
+
+def test_cached_status_within_ttl(cached, clock):
+    clock[0] += convex_deploy.STATUS_CACHE_TTL / 2
+    assert convex_deploy.cached_status() == "listing"
+
+
+def test_cached_status_expires(cached, clock):
+    clock[0] += convex_deploy.STATUS_CACHE_TTL
+    assert convex_deploy.cached_status() is None
+
+
+def test_cached_status_invalidated_by_compose_edit(cached, project, bump_mtime):
+    bump_mtime(project / "docker-compose.yml")
+    assert convex_deploy.cached_status() is None
+
+
+def test_cached_status_empty(monkeypatch):
+    monkeypatch.setattr(convex_deploy, "_status_cache", None)
+    assert convex_deploy.cached_status() is None